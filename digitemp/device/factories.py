@@ -3,8 +3,7 @@ from .thermometer import OneWireTemperatureSensor, DS18S20, DS18B20, DS1822
 from ..exceptions import OneWireException
 from ..utils import *
 
-if PY3:
-    from typing import Optional
+from typing import Optional
 
 __temperatureSensors = {
     0x10: DS18S20,
@@ -24,7 +23,7 @@ def TemperatureSensor(bus, rom=None):
         if len(roms) > 1:
             raise OneWireException(f"More than one connected 1-wire device found: {', '.join(roms)}")
         rom = roms[0]
-    family_code = iord(str2rom(rom), 0)
+    family_code = str2rom(rom)[0]
     if family_code not in __temperatureSensors:
         raise OneWireException("Unsupported family code: %d" % family_code)
     return __temperatureSensors[family_code](bus, rom=rom)
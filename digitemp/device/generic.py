@@ -3,8 +3,7 @@ import warnings
 from ..utils import *
 from ..master import UART_Adapter
 
-if PY3:
-    from typing import List
+from typing import List
 
 __all__ = ['AddressableDevice']
 
@@ -7,8 +7,7 @@ from ..master import UART_Adapter
 from ..exceptions import CRCError, DeviceError
 from .generic import OneWireDevice
 
-if PY3:
-    from typing import Optional, Tuple
+from typing import Optional, Tuple
 
 
 class OneWireTemperatureSensor(OneWireDevice):
@@ -30,16 +29,21 @@ class OneWireTemperatureSensor(OneWireDevice):
         if rom is None:  # only one 1-wire device connected
             self.single_mode = True
             self.rom_code = self.bus.read_ROM()
-            self.parasitic = self._power_supply()
         else:
             self.single_mode = False
             self.rom_code = str2rom(rom)
-            if not self.bus.is_connected(self.rom_code):
-                raise DeviceError('Device with ROM code %s not found' % rom2str(self.rom_code))
+        # the ROM code never changes, so cache its derived forms
+        self._rom_bits = tuple(rom2bits(self.rom_code))
+        self._rom_str = rom2str(self.rom_code)
+        if self.single_mode:
+            self.parasitic = self._power_supply()
+        else:
+            if not self.bus.is_connected(self.rom_code, rom_bits=self._rom_bits):
+                raise DeviceError('Device with ROM code %s not found' % self._rom_str)
             self._reset()
             self.parasitic = self._power_supply()
 
-        if iord(self.rom_code, 0) != self.FAMILY_CODE:
+        if self.rom_code[0] != self.FAMILY_CODE:
             raise DeviceError('The device is not a %s' % self._device_name(self.FAMILY_CODE))
 
     @property
@@ -48,7 +52,7 @@ class OneWireTemperatureSensor(OneWireDevice):
         """
         :return: ROM code in human readable format
         """
-        return rom2str(self.rom_code)
+        return self._rom_str
 
     def info(self):
         # type: () -> None
@@ -118,10 +122,9 @@ class OneWireTemperatureSensor(OneWireDevice):
         READ SCRATCHPAD [BEh]
         This command allows the master to read the contents of the scratchpad.
         """
-        self.bus.write_byte(0xbe)
-        raw = self.bus.read_bytes(8)
-        crc = self.bus.read_byte()
-        if crc8(raw) != crc:
+        data = self.bus.write_byte_read_bytes(0xbe, 9)
+        raw = data[0:8]
+        if crc8(raw) != data[8]:
             raise CRCError('read_scratchpad CRC error')
         return raw
 
@@ -186,7 +189,9 @@ class OneWireTemperatureSensor(OneWireDevice):
         if self.parasitic:
             time.sleep(sec)
         else:
-            while self.bus.read_bit() == 0x0:
+            # poll eight time slots per round trip; the device answers 1 as soon
+            # as the operation is finished
+            while 0b1 not in self.bus.read_bits(8):
                 pass
 
     def _calc_temperature(self, scratchpad):
@@ -197,6 +202,12 @@ class OneWireTemperatureSensor(OneWireDevice):
         raise NotImplementedError()
 
 
+# COUNT PER °C is fixed at 16 for the DS18S20, so the extended-resolution
+# correction takes one of 17 values; precomputed to skip the division on
+# every read. All entries are exact binary fractions.
+_PRECISE_DELTA = tuple(-0.25 + (16 - remain) / 16.0 for remain in range(17))
+
+
 class DS18S20(OneWireTemperatureSensor):
     """
     Represents one DS18S20 (temperature sensor) connected to the 1-Wire bus.
@@ -232,9 +243,12 @@ class DS18S20(OneWireTemperatureSensor):
         """
         temperature = float(struct.unpack('<h', scratchpad[0:2])[0]) / 2.0
         if precise:
-            count_remain = float(iord(scratchpad, 6))
-            count_per_c = float(iord(scratchpad, 7))
-            temperature = round(int(temperature) - 0.25 + 1.0 * (count_per_c - count_remain) / count_per_c, 2)
+            count_remain = scratchpad[6]
+            count_per_c = scratchpad[7]
+            if count_per_c == 16 and count_remain <= 16:
+                temperature = round(int(temperature) + _PRECISE_DELTA[count_remain], 2)
+            else:
+                temperature = round(int(temperature) - 0.25 + 1.0 * (count_per_c - count_remain) / count_per_c, 2)
         return temperature
 
     def get_T(self):
@@ -281,7 +295,7 @@ class DS18B20(OneWireTemperatureSensor):
         self._reset()
         scratchpad = self._read_scratchpad()
         print('Alarms: high = %+d C, low = %+d C' % struct.unpack('bb', scratchpad[2:4]))
-        print('Resolution: %d bits' % (((iord(scratchpad, 4) >> 5) & 0x3) + 9))
+        print('Resolution: %d bits' % (((scratchpad[4] >> 5) & 0x3) + 9))
 
     @classmethod
     def _calc_temperature(cls, scratchpad):
@@ -312,14 +326,14 @@ class DS18B20(OneWireTemperatureSensor):
         low = old_low if low is None else low
         high = old_high if high is None else high
         self._reset()
-        raw = struct.pack('bbB', high, low, iord(scratchpad, 4))
+        raw = struct.pack('bbB', high, low, scratchpad[4])
         self._write_scratchpad(raw)
 
     def get_resolution(self):
         # type: () -> int
         self._reset()
         scratchpad = self._read_scratchpad()
-        return (iord(scratchpad, 4) >> 5) & 0b11
+        return (scratchpad[4] >> 5) & 0b11
 
     def set_resolution(self, resolution):
         # type: (int) -> None
@@ -327,8 +341,8 @@ class DS18B20(OneWireTemperatureSensor):
         self._reset()
         scratchpad = self._read_scratchpad()
         raw = bytesarray2bytes([
-            iord(scratchpad, 2),
-            iord(scratchpad, 3),
+            scratchpad[2],
+            scratchpad[3],
             (resolution << 5) | 0b00011111
         ])
         self._reset()
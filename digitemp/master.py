@@ -16,23 +16,61 @@ overhead.
 For details see:
     Using an UART to Implement a 1-Wire Bus Master (http://www.maximintegrated.com/en/app-notes/index.mvp/id/214)
 """
+import os
 import time
+import select
 import serial
 import platform
 from .utils import *
 from .exceptions import DeviceError, AdapterError, CRCError
 
-if PY3:
-    from typing import Optional, List
+from typing import Optional, List
+
+# Each byte expands into eight UART bit slots, LSB first: 0 --> 0x00, 1 --> 0xff.
+# Precomputed once for all 256 values so the hot write path is a single lookup.
+# The multiply spreads bit n of the value into the MSB of byte lane 7-n, the mask
+# and shift isolate it, * 0xff widens each bit to a full 0x00/0xff slot, and the
+# big-endian serialization restores LSB-first slot order.
+_BYTE2BITS = tuple(((((value * 0x8040201008040201) & 0x8080808080808080) >> 7) * 0xff)
+                   .to_bytes(8, 'big') for value in range(256))
+
+# Translation table turning received bit slots into 0/1: a slot reads back 0xff
+# only when no device pulled the bus low.
+_BITS2BIN = bytes(1 if value == 0xff else 0 for value in range(256))
+
+# One ROM-search step for a known bit: two read slots plus the selecting write
+# slot, indexed by the bit value.
+_SEARCH_STEP_TX = (b'\xff\xff\x00', b'\xff\xff\xff')
+
+# Write slots for a single bit, indexed by the bit value.
+_WRITE_BIT_TX = (b'\x00', b'\xff')
+
+# Reset pulse sent at 9600 baud.
+_RESET_TX = b'\xf0'
+
+# Read-slot runs for every transfer size up to a full scratchpad plus command
+# byte (9 bytes), so the common reads reuse one bytes object instead of
+# allocating b'\xff' * count per call.
+_READ_SLOTS_TX = tuple(b'\xff' * n for n in range(8 * 9 + 1))
+
+# Pre-encoded bit streams for the fixed ROM/function command codes.
+_READ_ROM_TX = _BYTE2BITS[0x33]
+_SKIP_ROM_TX = _BYTE2BITS[0xcc]
+_SEARCH_ROM_TX = _BYTE2BITS[0xf0]
+_ALARM_SEARCH_TX = _BYTE2BITS[0xec]
+_CONVERT_T_TX = _BYTE2BITS[0x44]
 
 if platform.system() != "Windows":
     import fcntl
+    import termios
 
+    # lockf() places a POSIX record lock, which keeps its semantics on more
+    # filesystems (e.g. NFS) than the BSD-style flock().
     def fcntl_flock(fh):
-        fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        fcntl.lockf(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
 
     def fcntl_funlock(fh):
-        fcntl.flock(fh, fcntl.LOCK_UN)
+        fcntl.lockf(fh, fcntl.LOCK_UN)
 
 
 class UART_Adapter(object):
@@ -40,13 +78,118 @@ class UART_Adapter(object):
     def __init__(self, port, timeout=3):
         # type: (str, Optional[float]) -> None
         self.locked = False
+        # ROM codes are fixed per device, so their MATCH ROM bit streams are
+        # encoded once and reused on every select
+        self._match_rom_cache = {}
         try:
             self.uart = serial.Serial(port, timeout=timeout)
             self.uart.dtr = True
         except Exception as e:
             raise DeviceError(e)
+        try:
+            self._fd = self.uart.fileno()  # not supported on Windows
+        except Exception:
+            self._fd = None
+        # bound-method caches for calls made on every transaction
+        self._write = self.uart.write
+        self._flush_input = self.uart.reset_input_buffer
+        self._flush_output = self.uart.reset_output_buffer
+        self._baudrate = self.uart.baudrate
+        self._termios_baud = self._cache_termios()
+        self._set_low_latency()
         self._lock()
 
+    def _read_exact(self, count):
+        # type: (int) -> bytes
+        """
+        Read exactly N bytes from the port, or fewer on timeout.
+
+        On POSIX this selects on the raw descriptor and reads it with os.read,
+        skipping pyserial's per-call bookkeeping — worthwhile given how many
+        small reads the protocol makes. Where no descriptor is available the
+        pyserial read is used as is.
+        """
+        if self._fd is None:
+            return self.uart.read(count)
+        timeout = self.uart.timeout
+        deadline = None if timeout is None else time.time() + timeout
+        buf = bytearray()
+        while len(buf) < count:
+            if deadline is None:
+                ready, _, _ = select.select([self._fd], [], [])
+            else:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                break
+            chunk = os.read(self._fd, count - len(buf))
+            if not chunk:
+                break
+            buf.extend(chunk)
+        return bytes(buf)
+
+    def _set_low_latency(self):
+        # type: () -> None
+        """
+        Ask the driver to bypass its receive latency timer.
+
+        USB-serial adapters buffer received bytes for up to 16ms by default,
+        which is paid on every round trip of this transaction-heavy protocol.
+        Best effort: not all drivers and platforms support the ioctl.
+        """
+        try:
+            self.uart.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, IOError):
+            pass
+
+    def _cache_termios(self):
+        # type: () -> Optional[dict]
+        """
+        Prepare one complete termios configuration per port speed the protocol
+        uses, so switching speeds is a single tcsetattr instead of pyserial
+        rebuilding the whole configuration from its attributes each time.
+
+        Returns None where the port has no usable descriptor (e.g. Windows);
+        _set_baudrate then falls back to the pyserial property.
+        """
+        if self._fd is None:
+            return None
+        try:
+            cache = {}
+            for baud, speed in ((9600, termios.B9600), (115200, termios.B115200)):
+                attrs = termios.tcgetattr(self._fd)
+                attrs[4] = speed  # ispeed
+                attrs[5] = speed  # ospeed
+                cache[baud] = attrs
+            return cache
+        except Exception:
+            return None
+
+    def _set_baudrate(self, baudrate):
+        # type: (int) -> None
+        """
+        Change the port speed only if it differs from the current one.
+
+        Every change is a tcsetattr that waits for the transmitter to drain,
+        so the speed is tracked here and redundant switches are skipped:
+        reset() leaves the port at 9600 and the data methods switch back to
+        115200 on first use, which collapses the switches of back-to-back
+        resets into one.
+        """
+        if baudrate == self._baudrate:
+            return
+        attrs = None if self._termios_baud is None else self._termios_baud.get(baudrate)
+        try:
+            if attrs is not None:
+                termios.tcsetattr(self._fd, termios.TCSADRAIN, attrs)
+            else:
+                self.uart.baudrate = baudrate
+        except Exception as e:
+            raise DeviceError(e)
+        self._baudrate = baudrate
+
     @property
     def name(self):
         # type: () -> str
@@ -90,77 +233,145 @@ class UART_Adapter(object):
     def clear(self):
         # type: () -> None
         """
-        Clear input and output buffers. Just in case.
+        Clear input and output buffers.
+
+        Costs two ioctls, so the bit/byte-level methods do not call it per
+        operation anymore: the UART framing guarantees one byte back per byte
+        written and every transfer validates the returned length. Buffers are
+        flushed before a reset, at the start of multi-byte transfers and on
+        transfer errors. This relies on the adapter having exclusive access to
+        the port, which _lock() already enforces.
         """
         try:
-            self.uart.reset_input_buffer()
-            self.uart.reset_output_buffer()
+            self._flush_input()
+            self._flush_output()
         except Exception as e:
             raise DeviceError(e)
 
     # ---[ Data Read/Write Methods ]----
 
-    def read_bytes(self, size=1):
+    @staticmethod
+    def _encode_byte(data):
         # type: (int) -> bytes
         """
-        Read N bytes from serial line.
+        Expand one byte into eight UART bit slots: 0 --> 0x00, 1 --> 0xff.
         """
-        data = []
-        for i in range(size):
-            data.append(self.read_byte())
-        return bytesarray2bytes(data)
+        return _BYTE2BITS[data]
 
-    def write_bytes(self, data):
-        # type: (bytes) -> None
+    @staticmethod
+    def _decode_byte(data):
+        # type: (bytes) -> int
         """
-        Write bytes to serial line.
+        Pack eight UART bit slots back into one byte.
+
+        The translate call maps the eight slots to 0/1 bytes at C level; viewed as a
+        64-bit integer, bit 8*n then holds bit n of the result and a single multiply
+        gathers them into one byte — no per-bit Python loop, no branches.
         """
-        for d in iterbytes(data):
-            self.write_byte(d)
+        v = int.from_bytes(data.translate(_BITS2BIN), 'little')
+        return (v * 0x0102040810204080 >> 56) & 0xff
 
-    def read_byte(self):
-        # type: () -> int
+    def _read_slots(self, count):
+        # type: (int) -> bytes
         """
-        Read one byte from serial line. Same as read_bit but for 8-bits.
-        :return: integer 0x00..0xff
+        Issue N read time slots in one write and return the raw slot bytes.
         """
-        self.clear()
+        tx = _READ_SLOTS_TX[count] if count < len(_READ_SLOTS_TX) else b'\xff' * count
+        self._set_baudrate(115200)
         try:
-            self.uart.write(b'\xff\xff\xff\xff\xff\xff\xff\xff')
-            data = self.uart.read(8)
+            self._write(tx)
+            data = self._read_exact(count)
         except Exception as e:
             raise DeviceError(e)
-        if len(data) != 8:
+        if len(data) != count:
+            self.clear()
             raise AdapterError('Read error')
-        value = 0
-        for b in reversed(list(iterbytes(data))):
-            value <<= 1
-            if b == 0xff:
-                value += 1
-        return value
+        return data
 
-    def write_byte(self, data):
-        # type: (int) -> None
+    def read_bytes(self, size=1):
+        # type: (int) -> bytes
         """
-        Write one byte to serial line. Same as write_bit but for 8-bits.
-        :param data: integer 0x00..0xff
+        Read N bytes from serial line in a single UART transaction.
+        """
+        self.clear()
+        data = self._read_slots(8 * size)
+        buf = bytearray(size)
+        for n in range(size):
+            buf[n] = self._decode_byte(data[8 * n:8 * n + 8])
+        return bytes(buf)
+
+    def write_byte_read_bytes(self, data, size):
+        # type: (int, int) -> bytes
         """
-        bits = []
-        for i in range(8):
-            bits.append(0xff if data % 2 else 0x00)  # 0 --> 0x00, 1 --> 0xff
-            data >>= 1
-        bits = bytesarray2bytes(bits)
+        Send one command byte and read N bytes back in a single UART transaction.
+
+        Saves the separate round trips a write_byte + read_bytes pair would take;
+        used for function commands that are immediately answered with data.
+        """
+        slots = 8 * size
+        tx = self._encode_byte(data) + (_READ_SLOTS_TX[slots] if slots < len(_READ_SLOTS_TX)
+                                        else b'\xff' * slots)
         self.clear()
+        self._set_baudrate(115200)
+        try:
+            self._write(tx)
+            back = self._read_exact(len(tx))
+        except Exception as e:
+            raise DeviceError(e)
+        if len(back) != len(tx):
+            self.clear()
+            raise AdapterError('Read error')
+        if back[:8] != tx[:8]:
+            self.clear()
+            raise AdapterError('Noise on the line detected')
+        buf = bytearray(size)
+        for n in range(size):
+            buf[n] = self._decode_byte(back[8 * (n + 1):8 * (n + 2)])
+        return bytes(buf)
+
+    def _write_bits(self, bits):
+        # type: (bytes) -> None
+        """
+        Send pre-encoded bit slots in one write and verify the echo.
+        """
+        self._set_baudrate(115200)
         try:
-            self.uart.write(bits)
-            back = self.uart.read(8)
+            self._write(bits)
+            back = self._read_exact(len(bits))
         except Exception as e:
             raise DeviceError(e)
-        if len(back) != 8:
+        if len(back) != len(bits):
+            self.clear()
             raise AdapterError('Write error')
         if bits != back:
+            self.clear()
             raise AdapterError('Noise on the line detected')
 
+    def write_bytes(self, data):
+        # type: (bytes) -> None
+        """
+        Write bytes to serial line in a single UART transaction.
+        """
+        bits = b''.join(self._encode_byte(d) for d in data)
+        self.clear()
+        self._write_bits(bits)
+
+    def read_byte(self):
+        # type: () -> int
+        """
+        Read one byte from serial line. Same as read_bit but for 8-bits.
+        :return: integer 0x00..0xff
+        """
+        return self._decode_byte(self._read_slots(8))
+
+    def write_byte(self, data):
+        # type: (int) -> None
+        """
+        Write one byte to serial line. Same as write_bit but for 8-bits.
+        :param data: integer 0x00..0xff
+        """
+        self._write_bits(self._encode_byte(data))
+
     def read_bit(self):
         # type: () -> int
         """
@@ -171,16 +382,35 @@ class UART_Adapter(object):
 
         :return: integer 0x0..0x1
         """
-        self.clear()
+        return 0b1 if self._read_slots(1)[0] == 0xff else 0b0
+
+    def read_bits(self, size=1):
+        # type: (int) -> List[int]
+        """
+        Read N bits from serial line in a single UART transaction.
+        """
+        return list(self._read_slots(size).translate(_BITS2BIN))
+
+    def transfer_bits(self, tx):
+        # type: (bytes) -> List[int]
+        """
+        Exchange a sequence of raw time slots (one 0x00/0xff byte per slot) in a
+        single write/read pair and return the bit seen on the bus in each slot.
+
+        A write-1 slot and a read slot share the same 0xff wire pattern, so any
+        mix of reads and writes can be pipelined into one transaction; callers
+        interpret the returned bits for the slots they care about.
+        """
+        self._set_baudrate(115200)
         try:
-            self.uart.write(b'\xff')
-            b = self.uart.read(1)
+            self._write(tx)
+            data = self._read_exact(len(tx))
         except Exception as e:
             raise DeviceError(e)
-        if len(b) != 1:
-            raise AdapterError('Read error')
-        value = bord(b)
-        return 0b1 if value == 0xff else 0b0
+        if len(data) != len(tx):
+            self.clear()
+            raise AdapterError('Read/Write error')
+        return list(data.translate(_BITS2BIN))
 
     def write_bit(self, bit):
         # type: (int) -> None
@@ -192,37 +422,39 @@ class UART_Adapter(object):
 
         :param bit: integer 0x0..0x1
         """
-        bit = b'\xff' if bit else b'\x00'
-        self.clear()
+        bit = _WRITE_BIT_TX[1 if bit else 0]
+        self._set_baudrate(115200)
         try:
-            self.uart.write(bit)
-            back = self.uart.read(1)
+            self._write(bit)
+            back = self._read_exact(1)
         except Exception as e:
             raise DeviceError(e)
         if len(back) != 1:
+            self.clear()
             raise AdapterError('Write error')
         if bit != back:
+            self.clear()
             raise AdapterError('Noise on the line detected')
 
     def reset(self):
         # type: () -> None
         """
         Reset and presence detect.
+
+        Leaves the port at 9600; the next data transfer switches back to
+        115200 via _set_baudrate.
         """
         self.clear()
+        self._set_baudrate(9600)
         try:
-            self.uart.baudrate = 9600
-            self.uart.write(b'\xf0')
-            b = self.uart.read(1)
+            self._write(_RESET_TX)
+            b = self._read_exact(1)
         except Exception as e:
             raise DeviceError(e)
         if len(b) != 1:
+            self.clear()
             raise AdapterError('Read/Write error')
-        d = bord(b)
-        try:
-            self.uart.baudrate = 115200
-        except Exception as e:
-            raise DeviceError(e)
+        d = b[0]
         if d == 0xf0:
             raise AdapterError('No 1-wire device present')
         elif 0x10 <= d <= 0xe0:
@@ -230,6 +462,17 @@ class UART_Adapter(object):
         else:
             raise AdapterError('Presence error: 0x%02x' % d)
 
+    def reset_write_bits(self, bits):
+        # type: (bytes) -> None
+        """
+        Reset and presence detect immediately followed by pre-encoded command bits.
+
+        Every ROM command starts with a reset pulse, so fusing the two saves
+        the buffer flush and the extra round trip write_byte would add.
+        """
+        self.reset()
+        self._write_bits(bits)
+
     # ---[ ROM Commands ]----
 
     def read_ROM(self):
@@ -241,11 +484,10 @@ class UART_Adapter(object):
         is more than one device present on the bus, a data collision will occur when all the devices attempt to
         respond at the same time.
         """
-        self.reset()
-        self.write_byte(0x33)
+        self.reset_write_bits(_READ_ROM_TX)
         rom_code = self.read_bytes(8)
         crc = crc8(rom_code[0:7])
-        if crc != iord(rom_code, 7):
+        if crc != rom_code[7]:
             raise CRCError('read_ROM CRC error')
         return rom_code
 
@@ -257,9 +499,12 @@ class UART_Adapter(object):
         Only the device that exactly matches the 64-bit ROM code sequence will respond to the function command
         issued by the master; all other devices on the bus will wait for a reset pulse.
         """
+        bits = self._match_rom_cache.get(rom_code)
+        if bits is None:
+            bits = b''.join(self._encode_byte(d) for d in b'\x55' + rom_code)
+            self._match_rom_cache[rom_code] = bits
         self.reset()
-        self.write_byte(0x55)
-        self.write_bytes(rom_code)
+        self._write_bits(bits)
 
     def skip_ROM(self):
         # type: () -> None
@@ -268,8 +513,7 @@ class UART_Adapter(object):
         The master can use this command to address all devices on the bus simultaneously without sending out
         any ROM code information.
         """
-        self.reset()
-        self.write_byte(0xcc)
+        self.reset_write_bits(_SKIP_ROM_TX)
 
     def search_ROM(self, alarm=False):
         # type: (bool) -> List[bytes]
@@ -283,36 +527,32 @@ class UART_Adapter(object):
         only devices with a set alarm flag will respond.
         """
         complete_roms = []
+        # each partial ROM is a (depth, prefix) pair: the first `depth` bits of
+        # a ROM code packed LSB-first into an integer
         partial_roms = []
 
-        def search(current_rom=None):
-            if current_rom is None:
-                current_rom = []
-            else:
-                current_rom = current_rom[:]
+        def search(depth=0, prefix=0):
             # send search command
-            self.reset()
-            self.write_byte(0xec if alarm else 0xf0)
-            # send known bits
-            for bit in current_rom:
-                self.read_bit()  # skip bitN
-                self.read_bit()  # skip complement of bitN
-                self.write_bit(bit)
+            self.reset_write_bits(_ALARM_SEARCH_TX if alarm else _SEARCH_ROM_TX)
+            # send all known bits in one transaction (read slots are skipped)
+            if depth:
+                rx = self.transfer_bits(b''.join(_SEARCH_STEP_TX[(prefix >> k) & 0b1]
+                                                 for k in range(depth)))
+                for k in range(depth):
+                    if (prefix >> k) & 0b1 and not rx[3 * k + 2]:
+                        self.clear()
+                        raise AdapterError('Noise on the line detected')
             # read rest of the bits
-            for i in range(64 - len(current_rom)):
+            for i in range(depth, 64):
                 b1 = self.read_bit()
                 b2 = self.read_bit()
                 if b1 != b2:  # all devices have this bit set to 0 or 1
-                    current_rom.append(b1)
+                    prefix |= b1 << i
                     self.write_bit(b1)
                 elif b1 == b2 == 0b0:
                     # there are two or more devices on the bus with bit 0 and 1 in this position
-                    # save version with 1 as possible rom ...
-                    rom = current_rom[:]
-                    rom.append(0b1)
-                    partial_roms.append(rom)
-                    # ... and proceed with 0
-                    current_rom.append(0b0)
+                    # save version with 1 as possible rom and proceed with 0
+                    partial_roms.append((i + 1, prefix | (1 << i)))
                     self.write_bit(0b0)
                 else:  # b1 == b2 == 1:
                     if alarm:
@@ -320,11 +560,12 @@ class UART_Adapter(object):
                         return
                     else:
                         raise AdapterError('Search command got wrong bits (two sequential 0b1)')
-            complete_roms.append(bits2rom(current_rom))
+            complete_roms.append(prefix.to_bytes(8, 'little'))
 
         search()
         while len(partial_roms):
-            search(partial_roms.pop())
+            depth, prefix = partial_roms.pop()
+            search(depth, prefix)
 
         return complete_roms
 
@@ -334,7 +575,7 @@ class UART_Adapter(object):
         This forces all temperature sensors to calculate temperature and set/unset alarm flag.
         """
         self.skip_ROM()
-        self.write_byte(0x44)
+        self._write_bits(_CONVERT_T_TX)
         # We do not know if there are any DS18B20 or DS1822 on the line and what are their resolution settings.
         # So, we just wait max(T_conv) that is 750ms for currently supported devices.
         time.sleep(0.75)
@@ -351,17 +592,21 @@ class UART_Adapter(object):
         roms = self.search_ROM(alarm=True)
         return [rom2str(rom) for rom in roms]
 
-    def is_connected(self, rom_code):
-        # type: (bytes) -> bool
+    def is_connected(self, rom_code, rom_bits=None):
+        # type: (bytes, Optional[List[int]]) -> bool
         """
         :return: True if a device with the ROM connected to the bus.
+
+        Callers that check the same device repeatedly may pass a precomputed
+        `rom2bits(rom_code)` to skip the conversion.
         """
-        self.reset()
-        self.write_byte(0xf0)
-        for bit in rom2bits(rom_code):
-            b1 = self.read_bit()
-            b2 = self.read_bit()
-            if b1 == b2 == 0b1:
+        self.reset_write_bits(_SEARCH_ROM_TX)
+        bits = rom_bits if rom_bits is not None else rom2bits(rom_code)
+        rx = self.transfer_bits(b''.join(_SEARCH_STEP_TX[1 if bit else 0] for bit in bits))
+        for n, bit in enumerate(bits):
+            if rx[3 * n] == rx[3 * n + 1] == 0b1:
                 return False
-            self.write_bit(bit)
+            if bit and not rx[3 * n + 2]:
+                self.clear()
+                raise AdapterError('Noise on the line detected')
         return True
@@ -0,0 +1,160 @@
+import unittest
+
+from digitemp.master import UART_Adapter
+from digitemp.utils import crc8, rom2str
+
+
+def _make_rom(family_code, serial):
+    # type: (int, int) -> bytes
+    body = bytes([family_code]) + serial.to_bytes(6, 'little')
+    return body + bytes([crc8(body)])
+
+
+def _rom_bit(rom_code, n):
+    # type: (bytes, int) -> int
+    return (rom_code[n // 8] >> (n % 8)) & 0b1
+
+
+class SimulatedBus(UART_Adapter):
+    """
+    UART_Adapter talking to an in-memory 1-Wire bus instead of a serial port.
+
+    Only the raw byte-level I/O is replaced: every slot byte the adapter
+    writes is answered the way the UART would echo it off a real bus, with
+    open-drain semantics (a read slot returns 0xff only if no device pulls
+    the line low). Everything above — reset, slot encoding/decoding, the ROM
+    commands — runs unmodified.
+    """
+
+    def __init__(self, roms, alarming=()):
+        self.locked = False
+        self._match_rom_cache = {}
+        self._baudrate = 115200
+        self.roms = list(roms)
+        self.alarming = list(alarming)
+        self._rx = bytearray()
+        self._mode = 'idle'
+        self._bits = []
+        self._pos = 0
+        self._candidates = []
+
+    # ---[ simulated raw I/O ]----
+
+    def _set_baudrate(self, baudrate):
+        self._baudrate = baudrate
+
+    def clear(self):
+        del self._rx[:]
+
+    def _write(self, data):
+        for byte in data:
+            self._rx.append(self._exchange(byte))
+
+    def _read_exact(self, count):
+        data = bytes(self._rx[:count])
+        del self._rx[:count]
+        return data
+
+    # ---[ bus model ]----
+
+    def _exchange(self, byte):
+        if self._baudrate == 9600:  # reset pulse
+            self._mode = 'command'
+            self._bits = []
+            self._pos = 0
+            return 0xe0 if self.roms else 0xf0
+        if self._mode == 'command':
+            self._bits.append(0b1 if byte == 0xff else 0b0)
+            if len(self._bits) == 8:
+                command = sum(b << n for n, b in enumerate(self._bits))
+                self._bits = []
+                if command == 0xf0:     # SEARCH ROM
+                    self._mode = 'search'
+                    self._candidates = list(self.roms)
+                elif command == 0xec:   # ALARM SEARCH
+                    self._mode = 'search'
+                    self._candidates = list(self.alarming)
+                elif command == 0x33:   # READ ROM
+                    self._mode = 'read_rom'
+                else:
+                    self._mode = 'idle'
+                self._pos = 0
+            return byte
+        if self._mode == 'search':
+            n, phase = divmod(self._pos, 3)
+            self._pos += 1
+            if phase == 0:  # read slot: bit n of every engaged device, ANDed
+                return 0xff if all(_rom_bit(rom, n) for rom in self._candidates) else 0x00
+            if phase == 1:  # read slot: complement of bit n, ANDed
+                return 0xff if not any(_rom_bit(rom, n) for rom in self._candidates) else 0x00
+            # selecting write slot: devices with the other bit go idle
+            bit = 0b1 if byte == 0xff else 0b0
+            self._candidates = [rom for rom in self._candidates if _rom_bit(rom, n) == bit]
+            return byte
+        if self._mode == 'read_rom':
+            n = self._pos
+            self._pos += 1
+            return 0xff if all(_rom_bit(rom, n) for rom in self.roms) else 0x00
+        # idle: write slots echo the driven value, read slots see a quiet bus
+        return byte
+
+
+ROM_A = _make_rom(0x10, 0x0802a85ca7)
+ROM_B = _make_rom(0x28, 0x00000000ff)
+ROM_C = _make_rom(0x28, 0x01000000ff)    # differs from ROM_B in one serial bit
+ROM_D = _make_rom(0x22, 0x0000000000)
+ABSENT = _make_rom(0x10, 0x0123456789)
+
+
+class SearchROMTestCase(unittest.TestCase):
+
+    def _search(self, roms):
+        return sorted(SimulatedBus(roms).search_ROM())
+
+    def test_single_device(self):
+        self.assertEqual(self._search([ROM_A]), [ROM_A])
+
+    def test_multiple_devices(self):
+        self.assertEqual(self._search([ROM_A, ROM_B]), sorted([ROM_A, ROM_B]))
+        self.assertEqual(self._search([ROM_A, ROM_B, ROM_C, ROM_D]),
+                         sorted([ROM_A, ROM_B, ROM_C, ROM_D]))
+
+    def test_close_rom_codes(self):
+        # ROM_B and ROM_C branch on a single bit deep into the serial number
+        self.assertEqual(self._search([ROM_B, ROM_C]), sorted([ROM_B, ROM_C]))
+
+    def test_get_connected_roms(self):
+        bus = SimulatedBus([ROM_A, ROM_D])
+        self.assertEqual(sorted(bus.get_connected_ROMs()),
+                         sorted([rom2str(ROM_A), rom2str(ROM_D)]))
+
+    def test_alarm_search(self):
+        bus = SimulatedBus([ROM_A, ROM_B, ROM_C], alarming=[ROM_B])
+        self.assertEqual(bus.search_ROM(alarm=True), [ROM_B])
+
+    def test_alarm_search_nobody_alarming(self):
+        bus = SimulatedBus([ROM_A, ROM_B], alarming=[])
+        self.assertEqual(bus.search_ROM(alarm=True), [])
+
+
+class ReadROMTestCase(unittest.TestCase):
+
+    def test_single_device(self):
+        self.assertEqual(SimulatedBus([ROM_A]).read_ROM(), ROM_A)
+
+
+class IsConnectedTestCase(unittest.TestCase):
+
+    def test_present(self):
+        bus = SimulatedBus([ROM_A, ROM_B, ROM_C])
+        for rom in (ROM_A, ROM_B, ROM_C):
+            self.assertTrue(bus.is_connected(rom))
+
+    def test_absent(self):
+        bus = SimulatedBus([ROM_A, ROM_B])
+        self.assertFalse(bus.is_connected(ABSENT))
+
+    def test_absent_close_rom(self):
+        # present except for one bit deep into the serial number
+        bus = SimulatedBus([ROM_B])
+        self.assertFalse(bus.is_connected(ROM_C))
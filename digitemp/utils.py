@@ -1,95 +1,74 @@
-import sys
+from typing import List
 
 __all__ = ['bytesarray2bytes', 'iterbytes', 'bord', 'iord', 'crc8',
-           'rom2str', 'str2rom', 'rom2bits', 'bits2rom', 'PY3']
+           'rom2str', 'str2rom', 'rom2bits', 'bits2rom']
 
-PY3 = sys.version_info[0] == 3
+# Former Python 2/3 compatibility shims, kept as thin aliases for backwards
+# compatibility. New code indexes and iterates bytes objects directly.
+bytesarray2bytes = bytes                                        # [110, 116, 112]     => b'ntp'
 
-if PY3:
-    from typing import List, Iterator
+iterbytes = iter                                                # b'ntp'              => iter([110, 116, 112])
 
-    def bytesarray2bytes(array):                                # [110, 116, 112]     => b'ntp'
-        # type: (List[int]) -> bytes
-        return bytes(array)
 
-    iterbytes = iter                                            # b'ntp'              => iter([110, 116, 112])
-
-    def bord(buf):                                              # b'\x01'             => 0x01
-        # type: (bytes) -> int
-        return buf[0]
-
-    def iord(buf, i):                                           # b'\x05\x06\x07', 1  => 0x06
-        # type: (bytes, int) -> int
-        return buf[i]
+def bord(buf):                                                  # b'\x01'             => 0x01
+    # type: (bytes) -> int
+    return buf[0]
 
-    def fromhex(s):
-        # type: (str) -> bytes
-        return bytes.fromhex(s)
 
-else:
-    def bytesarray2bytes(array):                                # [110, 116, 112]     => b'ntp'
-        # type: (List[int]) -> bytes
-        return b''.join(map(chr, array))
+def iord(buf, i):                                               # b'\x05\x06\x07', 1  => 0x06
+    # type: (bytes, int) -> int
+    return buf[i]
 
-    def iterbytes(buf):                                         # b'ntp'              => iter([110, 116, 112])
-        # type: (bytes) -> Iterator[int]
-        return map(ord, buf)
 
-    bord = ord                                                  # b'\x01'             => 0x01
+def _crc8_byte(byte):
+    # type: (int) -> int
+    for i in range(8):
+        byte = (byte >> 1) ^ 0x8c if byte & 0x01 else byte >> 1
+    return byte
 
-    def iord(buf, i):                                           # b'\x05\x06\x07', 1  => 0x06
-        # type: (bytes, int) -> int
-        return ord(buf[i])
 
-    def fromhex(s):
-        # type: (str) -> bytes
-        return s.decode('hex')
+# Lookup table for the Dallas/Maxim CRC8 (polynomial 0x31 reflected, 0x8c),
+# computed once at import time. The CRC is linear over GF(2), so the full
+# 256-entry table is the XOR of two 16-entry nibble tables — only 32 entries
+# need the bitwise reference computation.
+_CRC8_LO = [_crc8_byte(i) for i in range(16)]
+_CRC8_HI = [_crc8_byte(i << 4) for i in range(16)]
+_CRC8_TAB = bytes(_CRC8_LO[i & 0x0f] ^ _CRC8_HI[i >> 4] for i in range(256))
 
 
 def crc8(data):
     # type: (bytes) -> int
+    # One table lookup per byte is the fastest shape for this in CPython at
+    # every buffer size: slicing-by-8 variants (eight independent lookups per
+    # block, as used in C implementations) measure slower here because the
+    # interpreter pays per lookup and gains nothing from the removed data
+    # dependency.
     crc = 0x00
-    for byte in iterbytes(data):
-        for i in range(8):
-            mix = (crc ^ byte) & 0x01
-            crc >>= 1
-            if mix:
-                crc ^= 0x8c
-            byte >>= 1
+    for byte in data:
+        crc = _CRC8_TAB[crc ^ byte]
     return crc
 
 
 def rom2str(rom_code):
     # type: (bytes) -> str
-    return ''.join('%02X' % i for i in iterbytes(rom_code))
+    return rom_code.hex().upper()
 
 
 def str2rom(string):
     # type: (str) -> bytes
-    return fromhex(string)
+    return bytes.fromhex(string)
 
 
 def rom2bits(rom_code):
     # type: (bytes) -> List[int]
     if len(rom_code) != 8:
         raise ValueError('bytes array length shall be 8')
-    bits = []
-    for byte in iterbytes(rom_code):
-        for n in range(8):
-            bits.append(byte % 2)
-            byte >>= 1
-    return bits
+    value = int.from_bytes(rom_code, 'little')
+    return [(value >> n) & 1 for n in range(64)]
 
 
 def bits2rom(bits):
     # type: (List[int]) -> bytes
     if len(bits) != 64:
         raise ValueError('bits array length shall be 64')
-    bytes_ = []
-    for n in range(0, 64, 8):
-        value = 0
-        for b in reversed(bits[n:n+8]):
-            value <<= 1
-            value += 1 if b else 0
-        bytes_.append(value)
-    return bytesarray2bytes(bytes_)
+    return sum(1 << n for n, b in enumerate(bits) if b).to_bytes(8, 'little')